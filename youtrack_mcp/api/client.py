@@ -1,7 +1,9 @@
 """
 Base client for YouTrack REST API.
 """
+import atexit
 import logging
+import threading
 import time
 from typing import Any, Dict, List, Optional, Union
 import json
@@ -10,6 +12,12 @@ import random
 import requests
 from pydantic import BaseModel, Field, model_validator
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional - response.json() is used as the fallback
+    orjson = None
+
 from youtrack_mcp.config import config
 
 logger = logging.getLogger(__name__)
@@ -68,8 +76,12 @@ class YouTrackModel(BaseModel):
 
 class YouTrackClient:
     """Base client for YouTrack REST API."""
-    
-    def __init__(self, base_url: Optional[str] = None, api_token: Optional[str] = None, 
+
+    # Process-wide shared instance, created lazily by get_shared()
+    _shared_client: Optional["YouTrackClient"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, base_url: Optional[str] = None, api_token: Optional[str] = None,
                  verify_ssl: Optional[bool] = None, max_retries: int = 3, retry_delay: float = 1.0):
         """
         Initialize YouTrack API client.
@@ -109,7 +121,29 @@ class YouTrackClient:
             requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
         
         logger.debug(f"YouTrack client initialized for {'YouTrack Cloud' if config.is_cloud_instance() else self.base_url}")
-    
+
+    @classmethod
+    def get_shared(cls) -> "YouTrackClient":
+        """
+        Get the process-wide shared client instance.
+
+        Tool classes should prefer this over constructing their own client so
+        that all requests reuse one connection pool (HTTP keep-alive and TLS
+        session reuse) instead of paying a handshake per tool instance. The
+        shared client is created on first use with the default configuration
+        and closed automatically at interpreter exit.
+
+        Returns:
+            The shared YouTrackClient instance
+        """
+        if cls._shared_client is None:
+            with cls._shared_lock:
+                if cls._shared_client is None:
+                    client = cls()
+                    atexit.register(client.close)
+                    cls._shared_client = client
+        return cls._shared_client
+
     def _get_api_url(self, endpoint: str) -> str:
         """
         Construct full API URL from endpoint.
@@ -147,8 +181,12 @@ class YouTrackClient:
                 return {}
             
             try:
+                if orjson is not None:
+                    # orjson decodes large payloads (e.g. search results with
+                    # high limits) noticeably faster than the stdlib parser
+                    return orjson.loads(response.content)
                 return response.json()
-            except json.JSONDecodeError:
+            except ValueError:
                 # Handle non-JSON responses
                 logger.warning(f"Non-JSON response received from API: {response.content[:100]}")
                 return {"raw_content": response.content.decode("utf-8", errors="replace")}
@@ -3,7 +3,14 @@ YouTrack Issue MCP tools.
 """
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+
+from cachetools import TTLCache
+from pydantic import BaseModel
 
 from youtrack_mcp.api.client import YouTrackClient
 from youtrack_mcp.api.issues import IssuesClient
@@ -12,441 +19,593 @@ from youtrack_mcp.mcp_wrappers import sync_wrapper
 
 logger = logging.getLogger(__name__)
 
+def _json_default(obj: Any) -> Any:
+    """Convert Pydantic models (or other objects) encountered during serialization."""
+    return obj.model_dump() if isinstance(obj, BaseModel) else obj.__dict__
+
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        """Serialize an object to a pretty-printed JSON string using orjson."""
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    # orjson is optional - fall back to the standard library
+    def _dumps(obj: Any) -> str:
+        """Serialize an object to a pretty-printed JSON string."""
+        return json.dumps(obj, indent=2, default=_json_default)
+
+# Issue IDs are either readable (PROJECT-123) or internal (2-123); anything
+# else can be rejected up front without paying for an API round-trip
+_ISSUE_ID_RE = re.compile(r'^(?:[A-Za-z][A-Za-z0-9_]*-\d+|\d+-\d+)$')
+
+# Field selection shared by the issue retrieval tools, built once at import time
+_ISSUE_FIELDS = "id,summary,description,created,updated,project(id,name,shortName),reporter(id,login,name),assignee(id,login,name),customFields(id,name,value)"
+
+# Recently fetched issues, keyed by ("issue"|"raw", issue_id) and storing the
+# serialized JSON response; MCP sessions often re-fetch the same issue
+_ISSUE_CACHE: TTLCache = TTLCache(maxsize=256, ttl=30)
+
+# Work items rarely change mid-session; a short TTL lets get_work_items and
+# get_time_tracking share one fetch instead of hitting the API twice
+_WORK_ITEMS_CACHE: TTLCache = TTLCache(maxsize=128, ttl=5)
+
+# Project short-name -> internal ID resolutions; projects rarely change, so a
+# longer TTL saves a round-trip on every create_issue that uses a short name
+_PROJECT_ID_CACHE: TTLCache = TTLCache(maxsize=64, ttl=300)
+
+
+def _invalidate_issue_cache(issue_id: str) -> None:
+    """Drop any cached responses for an issue after it has been modified."""
+    _ISSUE_CACHE.pop(("issue", issue_id), None)
+    _ISSUE_CACHE.pop(("raw", issue_id), None)
+
+
+def _tool_error_boundary(arg_name: str, log_message: str, include_status: bool = False) -> Callable:
+    """
+    Build the shared catch/log/error-JSON tail for a tool method.
+
+    Every tool ends the same way: catch any exception, log it with the
+    argument that identifies the request, and return the standard error JSON.
+    Instead of repeating that try/except in each method body, the wrapper is
+    generated once at import time with the log message, identifying argument
+    and error-payload shape baked into the closure, so the per-call cost is a
+    single extra frame and the method bodies keep only their happy path.
+
+    Args:
+        arg_name: Name of the argument to include in the log message
+        log_message: Lazy %-style log message with one placeholder
+        include_status: Whether the error payload carries "status": "error"
+
+    Returns:
+        Decorator applying the error boundary to a tool method
+    """
+    def decorate(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:
+                logger.error(log_message, kwargs.get(arg_name, args[0] if args else None), exc_info=True)
+                error = {"error": str(e)}
+                if include_status:
+                    error["status"] = "error"
+                return _dumps(error)
+        return wrapper
+    return decorate
+
+
+def _accept_dict_first_arg(func: Callable) -> Callable:
+    """
+    Unpack the kwargs-dict calling convention used by some MCP clients.
+
+    When all create_issue parameters arrive as a single JSON object in the
+    first argument, remap them to the real parameters before the tool body
+    runs, keeping the common path free of the shim check.
+    """
+    @wraps(func)
+    def wrapper(self, project=None, summary=None, description=None):
+        if isinstance(project, dict) and 'project' in project and 'summary' in project:
+            logger.info("Detected project as a dictionary, extracting parameters")
+            description = project.get('description', None)
+            summary = project.get('summary')
+            project = project.get('project')
+        return func(self, project, summary, description)
+    return wrapper
+
+# Tool definitions are static, so build them once at import time
+_TOOL_DEFINITIONS = {
+    "get_issue": {
+        "description": "Get information about a specific issue in YouTrack. Returns detailed information including custom fields.",
+        "parameter_descriptions": {
+            "issue_id": "The issue ID or readable ID (e.g., PROJECT-123)"
+        }
+    },
+    "search_issues": {
+        "description": "Search for issues using YouTrack query language. Supports all YouTrack search syntax.",
+        "parameter_descriptions": {
+            "query": "The search query (e.g., 'project: DEMO #Unresolved')",
+            "limit": "Maximum number of issues to return (optional, default: 10)"
+        }
+    },
+    "get_issues_bulk": {
+        "description": "Get information about multiple specific issues at once. Faster than calling get_issue repeatedly.",
+        "parameter_descriptions": {
+            "issue_ids": "List of issue IDs or readable IDs (e.g., ['DEMO-123', 'DEMO-124'])"
+        }
+    },
+    "create_issue": {
+        "description": "Create a new issue in YouTrack with the specified details.",
+        "parameter_descriptions": {
+            "project": "The project ID or short name (e.g., 'DEMO' or '0-0')",
+            "summary": "The issue title/summary",
+            "description": "Detailed description of the issue (optional)"
+        }
+    },
+    "add_comment": {
+        "description": "Add a comment to an existing issue in YouTrack.",
+        "parameter_descriptions": {
+            "issue_id": "The issue ID or readable ID (e.g., PROJECT-123)",
+            "text": "The comment text to add to the issue"
+        }
+    },
+    "get_comments": {
+        "description": "Get all comments for a specific issue, including author information and timestamps.",
+        "parameter_descriptions": {
+            "issue_id": "The issue ID or readable ID (e.g., PROJECT-123)",
+            "limit": "Maximum number of comments to return (optional, default: 50)"
+        }
+    },
+    "get_work_items": {
+        "description": "Get work items (time tracking entries) for a specific issue, showing who logged time and when.",
+        "parameter_descriptions": {
+            "issue_id": "The issue ID or readable ID (e.g., PROJECT-123)",
+            "limit": "Maximum number of work items to return (optional, default: 100)"
+        }
+    },
+    "get_time_tracking": {
+        "description": "Get comprehensive time tracking summary for an issue, including estimation, spent time, and breakdown by author.",
+        "parameter_descriptions": {
+            "issue_id": "The issue ID or readable ID (e.g., PROJECT-123)"
+        }
+    },
+    "get_issue_raw": {
+        "description": "Get raw information about a specific issue, bypassing the Pydantic model.",
+        "parameter_descriptions": {
+            "issue_id": "The issue ID or readable ID (e.g., PROJECT-123)"
+        }
+    }
+}
+
 
 class IssueTools:
     """Issue-related MCP tools."""
-    
+
     def __init__(self):
         """Initialize the issue tools."""
-        self.client = YouTrackClient()
+        self.client = YouTrackClient.get_shared()
         self.issues_api = IssuesClient(self.client)
-    
-    @sync_wrapper    
+        self.projects_api = ProjectsClient(self.client)
+
+    def _fetch_work_items(self, issue_id: str, limit: int) -> List[Any]:
+        """
+        Fetch work items for an issue, caching the result briefly.
+
+        Args:
+            issue_id: The issue ID or readable ID
+            limit: Maximum number of work items to fetch
+
+        Returns:
+            List of work items from the cache or the API
+        """
+        key = (issue_id, limit)
+        work_items = _WORK_ITEMS_CACHE.get(key)
+        if work_items is None:
+            work_items = self.issues_api.get_work_items(issue_id, limit)
+            _WORK_ITEMS_CACHE[key] = work_items
+        return work_items
+
+    @sync_wrapper
+    @_tool_error_boundary("issue_id", "Error getting issue %s")
     def get_issue(self, issue_id: str) -> str:
         """
         Get information about a specific issue.
-        
+
         FORMAT: get_issue(issue_id="DEMO-123") - You must use the exact parameter name 'issue_id'.
-        
+
         Args:
             issue_id: The issue ID or readable ID (e.g., PROJECT-123)
-            
+
         Returns:
             JSON string with issue information
         """
-        try:
-            # First try to get the issue data with explicit fields
-            fields = "id,summary,description,created,updated,project(id,name,shortName),reporter(id,login,name),assignee(id,login,name),customFields(id,name,value)"
-            raw_issue = self.client.get(f"issues/{issue_id}?fields={fields}")
-            
-            # If we got a minimal response, enhance it with default values
-            if isinstance(raw_issue, dict) and raw_issue.get('$type') == 'Issue' and 'summary' not in raw_issue:
-                raw_issue['summary'] = f"Issue {issue_id}"  # Provide a default summary
-            
-            # Return the raw issue data directly - avoid model validation issues
-            return json.dumps(raw_issue, indent=2)
-            
-        except Exception as e:
-            logger.exception(f"Error getting issue {issue_id}")
-            return json.dumps({"error": str(e)})
-    
-    @sync_wrapper    
+        if not _ISSUE_ID_RE.match(issue_id):
+            return _dumps({"error": f"Invalid issue id: {issue_id}"})
+
+        cached = _ISSUE_CACHE.get(("issue", issue_id))
+        if cached is not None:
+            return cached
+
+        # First try to get the issue data with explicit fields
+        raw_issue = self.client.get(f"issues/{issue_id}", params={"fields": _ISSUE_FIELDS})
+
+        # If we got a minimal response, enhance it with default values
+        if isinstance(raw_issue, dict) and raw_issue.get('$type') == 'Issue' and 'summary' not in raw_issue:
+            raw_issue['summary'] = f"Issue {issue_id}"  # Provide a default summary
+
+        # Return the raw issue data directly - avoid model validation issues
+        response = _dumps(raw_issue)
+        _ISSUE_CACHE[("issue", issue_id)] = response
+        return response
+
+    @sync_wrapper
+    @_tool_error_boundary("query", "Error searching issues with query: %s")
     def search_issues(self, query: str, limit: int = 10) -> str:
         """
         Search for issues using YouTrack query language.
-        
+
         FORMAT: search_issues(query="project: DEMO #Unresolved", limit=10)
-        
+
         Args:
             query: The search query
             limit: Maximum number of issues to return
-            
+
         Returns:
             JSON string with matching issues
         """
-        try:
-            # Request with explicit fields to get complete data
-            fields = "id,summary,description,created,updated,project(id,name,shortName),reporter(id,login,name),assignee(id,login,name),customFields(id,name,value)"
-            params = {"query": query, "$top": limit, "fields": fields}
-            raw_issues = self.client.get("issues", params=params)
-            
-            # Return the raw issues data directly
-            return json.dumps(raw_issues, indent=2)
-            
-        except Exception as e:
-            logger.exception(f"Error searching issues with query: {query}")
-            return json.dumps({"error": str(e)})
-    
+        # Request with explicit fields to get complete data
+        params = {"query": query, "$top": limit, "fields": _ISSUE_FIELDS}
+        raw_issues = self.client.get("issues", params=params)
+
+        # Return the raw issues data directly
+        return _dumps(raw_issues)
+
+    @sync_wrapper
+    @_tool_error_boundary("issue_ids", "Error getting issues in bulk: %s")
+    def get_issues_bulk(self, issue_ids: List[str]) -> str:
+        """
+        Get information about multiple issues in parallel.
+
+        FORMAT: get_issues_bulk(issue_ids=["DEMO-123", "DEMO-124"])
+
+        Args:
+            issue_ids: List of issue IDs or readable IDs to fetch
+
+        Returns:
+            JSON string mapping each issue ID to its data, or to an error
+            if that particular issue could not be fetched
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(self.client.get, f"issues/{issue_id}", params={"fields": _ISSUE_FIELDS}): issue_id
+                for issue_id in issue_ids
+            }
+            for future in as_completed(futures):
+                issue_id = futures[future]
+                try:
+                    results[issue_id] = future.result()
+                except Exception as e:
+                    results[issue_id] = {"error": str(e)}
+
+        return _dumps(results)
+
     @sync_wrapper
+    @_tool_error_boundary("project", "Error creating issue in project %s", include_status=True)
+    @_accept_dict_first_arg
     def create_issue(self, project: str, summary: str, description: Optional[str] = None) -> str:
         """
         Create a new issue in YouTrack.
-        
+
         FORMAT: create_issue(project="DEMO", summary="Bug: Login not working", description="Details here")
-        
+
         Args:
             project: The ID or short name of the project
             summary: The issue summary
             description: The issue description (optional)
-            
+
         Returns:
             JSON string with the created issue information
         """
-        try:
-            # Check if we got proper parameters
-            logger.debug(f"Creating issue with: project={project}, summary={summary}, description={description}")
-            
-            # Handle kwargs format from MCP
-            if isinstance(project, dict) and 'project' in project and 'summary' in project:
-                # Extract from dict if we got project as a JSON object
-                logger.info("Detected project as a dictionary, extracting parameters")
-                description = project.get('description', None)
-                summary = project.get('summary')
-                project = project.get('project')
-                
-            # Ensure we have valid data
-            if not project:
-                return json.dumps({"error": "Project is required", "status": "error"})
-            if not summary:
-                return json.dumps({"error": "Summary is required", "status": "error"})
-            
-            # Check if project is a project ID or short name
-            project_id = project
-            if project and not project.startswith("0-"):
+        # Check if we got proper parameters
+        logger.debug("Creating issue with: project=%s, summary=%s, description=%s", project, summary, description)
+
+        # Ensure we have valid data
+        if not project:
+            return _dumps({"error": "Project is required", "status": "error"})
+        if not summary:
+            return _dumps({"error": "Summary is required", "status": "error"})
+
+        # Check if project is a project ID or short name
+        project_id = project
+        if project and not project.startswith("0-"):
+            cached_id = _PROJECT_ID_CACHE.get(project)
+            if cached_id is not None:
+                project_id = cached_id
+            else:
                 # Try to get the project ID from the short name (e.g., "DEMO")
                 try:
-                    logger.info(f"Looking up project ID for: {project}")
-                    projects_api = ProjectsClient(self.client)
-                    project_obj = projects_api.get_project_by_name(project)
+                    logger.info("Looking up project ID for: %s", project)
+                    project_obj = self.projects_api.get_project_by_name(project)
                     if project_obj:
-                        logger.info(f"Found project {project_obj.name} with ID {project_obj.id}")
+                        logger.info("Found project %s with ID %s", project_obj.name, project_obj.id)
                         project_id = project_obj.id
+                        # Remember both the short-name and self mappings
+                        _PROJECT_ID_CACHE[project] = project_id
+                        _PROJECT_ID_CACHE[project_id] = project_id
                     else:
-                        logger.warning(f"Project not found: {project}")
-                        return json.dumps({"error": f"Project not found: {project}", "status": "error"})
+                        logger.warning("Project not found: %s", project)
+                        return _dumps({"error": f"Project not found: {project}", "status": "error"})
                 except Exception as e:
-                    logger.warning(f"Error finding project: {str(e)}")
-                    return json.dumps({"error": f"Error finding project: {str(e)}", "status": "error"})
-            
-            logger.info(f"Creating issue in project {project_id}: {summary}")
-            
-            # Call the API client to create the issue
-            try:
-                issue = self.issues_api.create_issue(project_id, summary, description)
-                
-                # Check if we got an issue with an ID
-                if isinstance(issue, dict) and issue.get('error'):
-                    # Handle error returned as a dict
-                    return json.dumps(issue)
-                
-                # Try to get full issue details right after creation
-                if hasattr(issue, 'id'):
-                    try:
-                        # Get the full issue details using issue ID
-                        issue_id = issue.id
-                        detailed_issue = self.issues_api.get_issue(issue_id)
-                        
-                        if hasattr(detailed_issue, 'model_dump'):
-                            return json.dumps(detailed_issue.model_dump(), indent=2)
-                        else:
-                            return json.dumps(detailed_issue, indent=2)
-                    except Exception as e:
-                        logger.warning(f"Could not retrieve detailed issue: {str(e)}")
-                        # Fall back to original issue
-                
-                # Original issue as fallback
-                if hasattr(issue, 'model_dump'):
-                    return json.dumps(issue.model_dump(), indent=2)
-                else:
-                    return json.dumps(issue, indent=2)
-            except Exception as e:
-                error_msg = str(e)
-                if hasattr(e, 'response') and e.response:
-                    try:
-                        # Try to get detailed error message from response
-                        error_content = e.response.content.decode('utf-8', errors='replace')
-                        error_msg = f"{error_msg} - {error_content}"
-                    except:
-                        pass
-                logger.error(f"API error creating issue: {error_msg}")
-                return json.dumps({"error": error_msg, "status": "error"})
-                
+                    logger.warning("Error finding project: %s", e)
+                    return _dumps({"error": f"Error finding project: {str(e)}", "status": "error"})
+
+        logger.info("Creating issue in project %s: %s", project_id, summary)
+
+        # Call the API client to create the issue
+        try:
+            issue = self.issues_api.create_issue(project_id, summary, description)
+
+            # Check if we got an issue with an ID
+            if isinstance(issue, dict) and issue.get('error'):
+                # Handle error returned as a dict
+                return _dumps(issue)
+
+            # Try to get full issue details right after creation
+            if hasattr(issue, 'id'):
+                try:
+                    # Get the full issue details using issue ID
+                    issue_id = issue.id
+                    _invalidate_issue_cache(issue_id)
+                    detailed_issue = self.issues_api.get_issue(issue_id)
+
+                    # _dumps serializes Pydantic models directly, no model_dump round-trip
+                    return _dumps(detailed_issue)
+                except Exception as e:
+                    logger.warning("Could not retrieve detailed issue: %s", e)
+                    # Fall back to original issue
+
+            # Original issue as fallback
+            return _dumps(issue)
         except Exception as e:
-            logger.exception(f"Error creating issue in project {project}")
-            return json.dumps({"error": str(e), "status": "error"})
-    
-    @sync_wrapper        
+            error_msg = str(e)
+            if hasattr(e, 'response') and e.response:
+                try:
+                    # Try to get detailed error message from response
+                    error_content = e.response.content.decode('utf-8', errors='replace')
+                    error_msg = f"{error_msg} - {error_content}"
+                except:
+                    pass
+            logger.error("API error creating issue: %s", error_msg)
+            return _dumps({"error": error_msg, "status": "error"})
+
+    @sync_wrapper
+    @_tool_error_boundary("issue_id", "Error adding comment to issue %s")
     def add_comment(self, issue_id: str, text: str) -> str:
         """
         Add a comment to an issue.
-        
+
         FORMAT: add_comment(issue_id="DEMO-123", text="This is my comment")
-        
+
         Args:
             issue_id: The issue ID or readable ID
             text: The comment text
-            
+
         Returns:
             JSON string with the result
         """
-        try:
-            result = self.issues_api.add_comment(issue_id, text)
-            return json.dumps(result, indent=2)
-        except Exception as e:
-            logger.exception(f"Error adding comment to issue {issue_id}")
-            return json.dumps({"error": str(e)})
-    
+        if not _ISSUE_ID_RE.match(issue_id):
+            return _dumps({"error": f"Invalid issue id: {issue_id}"})
+
+        result = self.issues_api.add_comment(issue_id, text)
+        # The cached issue data is stale once a comment has been added
+        _invalidate_issue_cache(issue_id)
+        return _dumps(result)
+
     @sync_wrapper
+    @_tool_error_boundary("issue_id", "Error getting comments for issue %s")
     def get_comments(self, issue_id: str, limit: int = 50) -> str:
         """
         Get comments for an issue.
-        
+
         FORMAT: get_comments(issue_id="DEMO-123", limit=50)
-        
+
         Args:
             issue_id: The issue ID or readable ID (e.g., PROJECT-123)
             limit: Maximum number of comments to return (default: 50)
-            
+
         Returns:
             JSON string with the list of comments
         """
-        try:
-            comments = self.issues_api.get_comments(issue_id, limit)
-            
-            # Convert to list of dictionaries
-            result = []
-            for comment in comments:
-                if hasattr(comment, 'model_dump'):
-                    comment_dict = comment.model_dump()
-                else:
-                    comment_dict = comment
-                
-                # Format the comment for better readability
-                formatted_comment = {
-                    "id": comment_dict.get("id"),
-                    "text": comment_dict.get("text"),
-                    "author": comment_dict.get("author", {}).get("name") or comment_dict.get("author", {}).get("login"),
-                    "author_details": comment_dict.get("author"),
-                    "created": comment_dict.get("created"),
-                    "updated": comment_dict.get("updated"),
-                    "deleted": comment_dict.get("deleted", False),
-                    "attachments": comment_dict.get("attachments", [])
-                }
-                result.append(formatted_comment)
-            
-            return json.dumps({
-                "issue_id": issue_id,
-                "total_comments": len(result),
-                "comments": result
-            }, indent=2)
-            
-        except Exception as e:
-            logger.exception(f"Error getting comments for issue {issue_id}")
-            return json.dumps({"error": str(e)})
-    
+        if not _ISSUE_ID_RE.match(issue_id):
+            return _dumps({"error": f"Invalid issue id: {issue_id}"})
+
+        comments = self.issues_api.get_comments(issue_id, limit)
+
+        # Convert to list of dictionaries
+        comment_dicts = [
+            comment.model_dump() if isinstance(comment, BaseModel) else comment
+            for comment in comments
+        ]
+
+        # Format the comments for better readability
+        result = [
+            {
+                "id": comment_dict.get("id"),
+                "text": comment_dict.get("text"),
+                "author": (author := comment_dict.get("author") or {}).get("name") or author.get("login"),
+                "author_details": comment_dict.get("author"),
+                "created": comment_dict.get("created"),
+                "updated": comment_dict.get("updated"),
+                "deleted": comment_dict.get("deleted", False),
+                "attachments": comment_dict.get("attachments", [])
+            }
+            for comment_dict in comment_dicts
+        ]
+
+        return _dumps({
+            "issue_id": issue_id,
+            "total_comments": len(result),
+            "comments": result
+        })
+
     @sync_wrapper
+    @_tool_error_boundary("issue_id", "Error getting work items for issue %s")
     def get_work_items(self, issue_id: str, limit: int = 100) -> str:
         """
         Get work items (time tracking entries) for an issue.
-        
+
         FORMAT: get_work_items(issue_id="DEMO-123", limit=100)
-        
+
         Args:
             issue_id: The issue ID or readable ID (e.g., PROJECT-123)
             limit: Maximum number of work items to return (default: 100)
-            
+
         Returns:
             JSON string with the list of work items (time tracking entries)
         """
-        try:
-            work_items = self.issues_api.get_work_items(issue_id, limit)
-            
-            # Convert to list of dictionaries
-            result = []
-            total_minutes = 0
-            
-            for item in work_items:
-                if hasattr(item, 'model_dump'):
-                    item_dict = item.model_dump()
-                else:
-                    item_dict = item
-                
-                # Format the work item for better readability
-                duration_minutes = item_dict.get("duration", 0) or 0
-                total_minutes += duration_minutes
-                
-                formatted_item = {
-                    "id": item_dict.get("id"),
-                    "duration_minutes": duration_minutes,
-                    "duration_hours": round(duration_minutes / 60, 2) if duration_minutes else 0,
-                    "date": item_dict.get("date"),
-                    "description": item_dict.get("description"),
-                    "author": item_dict.get("author", {}).get("name") or item_dict.get("author", {}).get("login"),
-                    "author_details": item_dict.get("author"),
-                    "type": item_dict.get("type", {}).get("name") if item_dict.get("type") else None,
-                    "created": item_dict.get("created"),
-                    "updated": item_dict.get("updated")
-                }
-                result.append(formatted_item)
-            
-            return json.dumps({
-                "issue_id": issue_id,
-                "total_work_items": len(result),
-                "total_duration_minutes": total_minutes,
-                "total_duration_hours": round(total_minutes / 60, 2),
-                "work_items": result
-            }, indent=2)
-            
-        except Exception as e:
-            logger.exception(f"Error getting work items for issue {issue_id}")
-            return json.dumps({"error": str(e)})
-    
+        if not _ISSUE_ID_RE.match(issue_id):
+            return _dumps({"error": f"Invalid issue id: {issue_id}"})
+
+        work_items = self._fetch_work_items(issue_id, limit)
+
+        # Convert to list of dictionaries
+        item_dicts = [
+            item.model_dump() if isinstance(item, BaseModel) else item
+            for item in work_items
+        ]
+        total_minutes = sum(item_dict.get("duration") or 0 for item_dict in item_dicts)
+
+        # Format the work items for better readability
+        result = [
+            {
+                "id": item_dict.get("id"),
+                "duration_minutes": (duration_minutes := item_dict.get("duration") or 0),
+                "duration_hours": duration_minutes and round(duration_minutes / 60, 2),
+                "date": item_dict.get("date"),
+                "description": item_dict.get("description"),
+                "author": (author := item_dict.get("author") or {}).get("name") or author.get("login"),
+                "author_details": item_dict.get("author"),
+                "type": item_dict.get("type", {}).get("name") if item_dict.get("type") else None,
+                "created": item_dict.get("created"),
+                "updated": item_dict.get("updated")
+            }
+            for item_dict in item_dicts
+        ]
+
+        return _dumps({
+            "issue_id": issue_id,
+            "total_work_items": len(result),
+            "total_duration_minutes": total_minutes,
+            "total_duration_hours": round(total_minutes / 60, 2),
+            "work_items": result
+        })
+
     @sync_wrapper
+    @_tool_error_boundary("issue_id", "Error getting time tracking for issue %s")
     def get_time_tracking(self, issue_id: str) -> str:
         """
         Get time tracking summary for an issue, including estimation and spent time.
-        
+
         FORMAT: get_time_tracking(issue_id="DEMO-123")
-        
+
         Args:
             issue_id: The issue ID or readable ID (e.g., PROJECT-123)
-            
+
         Returns:
             JSON string with time tracking summary including estimation, spent time, and work items
         """
-        try:
-            summary = self.issues_api.get_time_tracking_summary(issue_id)
-            
-            # Get work items for detailed breakdown
-            work_items = self.issues_api.get_work_items(issue_id, limit=100)
-            
-            # Group work items by author
-            by_author = {}
-            for item in work_items:
-                if hasattr(item, 'model_dump'):
-                    item_dict = item.model_dump()
-                else:
-                    item_dict = item
-                
-                author_name = item_dict.get("author", {}).get("name") or item_dict.get("author", {}).get("login") or "Unknown"
-                if author_name not in by_author:
-                    by_author[author_name] = {
-                        "total_minutes": 0,
-                        "total_hours": 0,
-                        "count": 0
-                    }
-                
-                duration = item_dict.get("duration", 0) or 0
-                by_author[author_name]["total_minutes"] += duration
-                by_author[author_name]["count"] += 1
-            
-            # Calculate hours for each author
-            for author_data in by_author.values():
-                author_data["total_hours"] = round(author_data["total_minutes"] / 60, 2)
-            
-            # Enhance the summary with additional information
-            enhanced_summary = {
-                "issue_id": issue_id,
-                "estimation": summary.get("estimation"),
-                "spent_time": summary.get("spent_time"),
-                "total_work_items": summary.get("work_items_count", 0),
-                "total_duration": {
-                    "minutes": summary.get("total_duration_minutes", 0),
-                    "hours": summary.get("total_duration_hours", 0)
-                },
-                "breakdown_by_author": by_author
+        if not _ISSUE_ID_RE.match(issue_id):
+            return _dumps({"error": f"Invalid issue id: {issue_id}"})
+
+        # The summary and work items are independent round-trips, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            summary_future = executor.submit(self.issues_api.get_time_tracking_summary, issue_id)
+            work_items_future = executor.submit(self._fetch_work_items, issue_id, 100)
+            summary = summary_future.result()
+            work_items = work_items_future.result()
+
+        # Group work items by author, accumulating [minutes, count] pairs
+        accumulator = defaultdict(lambda: [0, 0])
+        for item in work_items:
+            if isinstance(item, BaseModel):
+                item_dict = item.model_dump()
+            else:
+                item_dict = item
+
+            author = item_dict.get("author") or {}
+            author_name = author.get("name") or author.get("login") or "Unknown"
+            duration = item_dict.get("duration") or 0
+
+            entry = accumulator[author_name]
+            entry[0] += duration
+            entry[1] += 1
+
+        # Expand the accumulated pairs into the reported per-author stats
+        by_author = {
+            name: {
+                "total_minutes": minutes,
+                "total_hours": round(minutes / 60, 2),
+                "count": count
             }
-            
-            return json.dumps(enhanced_summary, indent=2)
-            
-        except Exception as e:
-            logger.exception(f"Error getting time tracking for issue {issue_id}")
-            return json.dumps({"error": str(e)})
-    
+            for name, (minutes, count) in accumulator.items()
+        }
+
+        # Enhance the summary with additional information
+        enhanced_summary = {
+            "issue_id": issue_id,
+            "estimation": summary.get("estimation"),
+            "spent_time": summary.get("spent_time"),
+            "total_work_items": summary.get("work_items_count", 0),
+            "total_duration": {
+                "minutes": summary.get("total_duration_minutes", 0),
+                "hours": summary.get("total_duration_hours", 0)
+            },
+            "breakdown_by_author": by_author
+        }
+
+        return _dumps(enhanced_summary)
+
     def close(self) -> None:
-        """Close the API client."""
-        self.client.close()
-        
+        """Close the API client.
+
+        The shared client stays open for other tool instances and is closed
+        automatically at interpreter exit.
+        """
+        pass
+
     def get_tool_definitions(self) -> Dict[str, Dict[str, Any]]:
         """
         Get the definitions of all issue tools.
-        
+
         Returns:
             Dictionary mapping tool names to their configuration
         """
-        return {
-            "get_issue": {
-                "description": "Get information about a specific issue in YouTrack. Returns detailed information including custom fields.",
-                "parameter_descriptions": {
-                    "issue_id": "The issue ID or readable ID (e.g., PROJECT-123)"
-                }
-            },
-            "search_issues": {
-                "description": "Search for issues using YouTrack query language. Supports all YouTrack search syntax.",
-                "parameter_descriptions": {
-                    "query": "The search query (e.g., 'project: DEMO #Unresolved')",
-                    "limit": "Maximum number of issues to return (optional, default: 10)"
-                }
-            },
-            "create_issue": {
-                "description": "Create a new issue in YouTrack with the specified details.",
-                "parameter_descriptions": {
-                    "project": "The project ID or short name (e.g., 'DEMO' or '0-0')",
-                    "summary": "The issue title/summary",
-                    "description": "Detailed description of the issue (optional)"
-                }
-            },
-            "add_comment": {
-                "description": "Add a comment to an existing issue in YouTrack.",
-                "parameter_descriptions": {
-                    "issue_id": "The issue ID or readable ID (e.g., PROJECT-123)",
-                    "text": "The comment text to add to the issue"
-                }
-            },
-            "get_comments": {
-                "description": "Get all comments for a specific issue, including author information and timestamps.",
-                "parameter_descriptions": {
-                    "issue_id": "The issue ID or readable ID (e.g., PROJECT-123)",
-                    "limit": "Maximum number of comments to return (optional, default: 50)"
-                }
-            },
-            "get_work_items": {
-                "description": "Get work items (time tracking entries) for a specific issue, showing who logged time and when.",
-                "parameter_descriptions": {
-                    "issue_id": "The issue ID or readable ID (e.g., PROJECT-123)",
-                    "limit": "Maximum number of work items to return (optional, default: 100)"
-                }
-            },
-            "get_time_tracking": {
-                "description": "Get comprehensive time tracking summary for an issue, including estimation, spent time, and breakdown by author.",
-                "parameter_descriptions": {
-                    "issue_id": "The issue ID or readable ID (e.g., PROJECT-123)"
-                }
-            },
-            "get_issue_raw": {
-                "description": "Get raw information about a specific issue, bypassing the Pydantic model.",
-                "parameter_descriptions": {
-                    "issue_id": "The issue ID or readable ID (e.g., PROJECT-123)"
-                }
-            }
-        }
-    
+        return _TOOL_DEFINITIONS
+
     @sync_wrapper
+    @_tool_error_boundary("issue_id", "Error getting raw issue %s")
     def get_issue_raw(self, issue_id: str) -> str:
         """
         Get raw information about a specific issue, bypassing the Pydantic model.
-        
+
         FORMAT: get_issue_raw(issue_id="DEMO-123")
-        
+
         Args:
             issue_id: The issue ID or readable ID
-            
+
         Returns:
             Raw JSON string with the issue data
         """
-        try:
-            raw_issue = self.client.get(f"issues/{issue_id}")
-            return json.dumps(raw_issue, indent=2)
-        except Exception as e:
-            logger.exception(f"Error getting raw issue {issue_id}")
-            return json.dumps({"error": str(e)})
+        if not _ISSUE_ID_RE.match(issue_id):
+            return _dumps({"error": f"Invalid issue id: {issue_id}"})
+
+        cached = _ISSUE_CACHE.get(("raw", issue_id))
+        if cached is not None:
+            return cached
+
+        raw_issue = self.client.get(f"issues/{issue_id}")
+        response = _dumps(raw_issue)
+        _ISSUE_CACHE[("raw", issue_id)] = response
+        return response